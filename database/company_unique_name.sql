@@ -0,0 +1,4 @@
+-- company_name is the natural key JobDatabaseInserter uses to resolve a whole
+-- batch of companies with one INSERT ... ON CONFLICT (company_name) upsert.
+-- Run once. Existing duplicate company_name rows must be merged first.
+ALTER TABLE company ADD CONSTRAINT company_name_uq UNIQUE (company_name);
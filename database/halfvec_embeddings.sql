@@ -0,0 +1,98 @@
+-- Store embeddings as half precision (requires pgvector >= 0.7). halfvec uses
+-- 2 bytes per dimension instead of 4, halving row, index and scan size, and
+-- HNSW can index halfvec up to 4000 dimensions (vector stops at 2000).
+--
+-- The dimension is not hard-coded: it is read from each column's declared
+-- vector(n) type, or, for an unconstrained vector column, from the rows it
+-- holds. The migration stops without changing anything if a column holds
+-- embeddings of mixed dimensions, if the job and skill columns disagree
+-- (insert_top_job_skills compares them with <=>), or if the dimension is too
+-- large for an HNSW index.
+--
+-- Indexes built with vector opclasses cannot survive the type change, so every
+-- HNSW/IVFFlat index on these columns is dropped and recreated under its
+-- original name and parameters with the matching halfvec opclass.
+
+DO $$
+DECLARE
+    target record;
+    column_dims integer;
+    dim_count integer;
+    dims integer;
+    index_defs text[] := '{}';
+    index_def text;
+    index_name text;
+BEGIN
+    FOR target IN
+        SELECT * FROM (VALUES
+            ('job', 'requirements_embedding'),
+            ('job', 'description_embedding'),
+            ('skill', 'embedding')
+        ) AS t (table_name, column_name)
+    LOOP
+        -- vector(n) keeps n as the column typmod; -1 means no declared dimension
+        SELECT NULLIF(atttypmod, -1) INTO column_dims
+        FROM pg_attribute
+        WHERE attrelid = target.table_name::regclass AND attname = target.column_name;
+
+        IF column_dims IS NULL THEN
+            EXECUTE format(
+                'SELECT count(DISTINCT vector_dims(%1$I)), min(vector_dims(%1$I)) FROM %2$I',
+                target.column_name, target.table_name
+            ) INTO dim_count, column_dims;
+            IF dim_count > 1 THEN
+                RAISE EXCEPTION '%.% holds embeddings of % different dimensions',
+                    target.table_name, target.column_name, dim_count;
+            END IF;
+        END IF;
+
+        IF column_dims IS NULL THEN
+            CONTINUE;  -- unconstrained and empty: takes the dimension of the others
+        ELSIF dims IS NULL THEN
+            dims := column_dims;
+        ELSIF dims <> column_dims THEN
+            RAISE EXCEPTION '%.% has % dimensions, other embedding columns have %',
+                target.table_name, target.column_name, column_dims, dims;
+        END IF;
+    END LOOP;
+
+    IF dims IS NULL THEN
+        RAISE EXCEPTION 'cannot infer the embedding dimension: no column declares one and all are empty';
+    ELSIF dims > 4000 THEN
+        RAISE EXCEPTION 'embeddings have % dimensions; HNSW indexes halfvec only up to 4000', dims;
+    END IF;
+    RAISE NOTICE 'converting embedding columns to halfvec(%)', dims;
+
+    -- Remember the vector indexes on the embedding columns, then drop them
+    FOR index_def, index_name IN
+        SELECT pg_get_indexdef(i.indexrelid), i.indexrelid::regclass::text
+        FROM pg_index i
+        JOIN pg_class c ON c.oid = i.indrelid
+        JOIN pg_class ic ON ic.oid = i.indexrelid
+        JOIN pg_am am ON am.oid = ic.relam
+        WHERE c.relname IN ('job', 'skill')
+          AND c.relnamespace = current_schema()::regnamespace
+          AND am.amname IN ('hnsw', 'ivfflat')
+    LOOP
+        index_defs := index_defs || regexp_replace(index_def, '\mvector_(\w+_ops)\M', 'halfvec_\1', 'g');
+        EXECUTE format('DROP INDEX %s', index_name);
+    END LOOP;
+
+    EXECUTE format(
+        'ALTER TABLE job
+             ALTER COLUMN requirements_embedding TYPE halfvec(%1$s) USING requirements_embedding::halfvec(%1$s),
+             ALTER COLUMN description_embedding TYPE halfvec(%1$s) USING description_embedding::halfvec(%1$s)',
+        dims
+    );
+    -- skill.embedding must match, so the <=> operator in insert_top_job_skills
+    -- still compares like with like.
+    EXECUTE format(
+        'ALTER TABLE skill ALTER COLUMN embedding TYPE halfvec(%1$s) USING embedding::halfvec(%1$s)',
+        dims
+    );
+
+    FOREACH index_def IN ARRAY index_defs LOOP
+        EXECUTE index_def;
+    END LOOP;
+END
+$$;
@@ -1,38 +1,47 @@
--- Step 1: Drop the function first, only if it already exists.
+-- Step 1: Drop the trigger and function first, only if they already exist.
+DROP TRIGGER IF EXISTS trigger_insert_job_skills ON job;
 DROP FUNCTION IF EXISTS insert_top_job_skills();
 
 -- Step 2: Now, create the function from scratch.
 CREATE FUNCTION insert_top_job_skills()
 RETURNS TRIGGER AS $$
 BEGIN
-    -- This condition checks if the newly inserted job has a non-NULL embedding.
-    IF NEW.requirements_embedding IS NOT NULL THEN
-
-        -- The INSERT statement will only run if the condition above is true.
-        INSERT INTO job_skill (job_id, skill_id, similarity)
+    -- One set-based INSERT covers every job added by the statement, so a
+    -- batch (COPY staging + INSERT ... SELECT) links all its skills at once.
+    INSERT INTO job_skill (job_id, skill_id, similarity)
+    SELECT
+        j.job_id,
+        top.skill_id,
+        top.similarity_score
+    FROM
+        new_jobs j
+    CROSS JOIN LATERAL (
         SELECT
-            NEW.job_id,
             s.skill_id,
-            1 - (NEW.requirements_embedding <=> s.embedding) AS similarity_score
+            1 - (j.requirements_embedding <=> s.embedding) AS similarity_score
         FROM
             skill s
         WHERE
             s.embedding IS NOT NULL
+        -- Ordering by distance (not by the derived score) lets an index on
+        -- skill.embedding serve the top-10 lookup.
         ORDER BY
-            similarity_score DESC
-        LIMIT 10;
-    END IF;
+            j.requirements_embedding <=> s.embedding
+        LIMIT 10
+    ) top
+    -- Only jobs with a non-NULL embedding get skills.
+    WHERE
+        j.requirements_embedding IS NOT NULL
+    ON CONFLICT (job_id, skill_id) DO NOTHING;
 
-    -- The RETURN NEW statement is required for AFTER triggers.
-    RETURN NEW;
+    -- The return value is ignored for statement-level AFTER triggers.
+    RETURN NULL;
 END;
 $$ LANGUAGE plpgsql;
 
--- Step 3: Drop the existing trigger to ensure a clean setup
-DROP TRIGGER IF EXISTS trigger_insert_job_skills ON job;
-
--- Step 4: Create the trigger that calls the function
+-- Step 3: Create the statement-level trigger; new_jobs holds every inserted row
 CREATE TRIGGER trigger_insert_job_skills
 AFTER INSERT ON job
-FOR EACH ROW
-EXECUTE FUNCTION insert_top_job_skills();
\ No newline at end of file
+REFERENCING NEW TABLE AS new_jobs
+FOR EACH STATEMENT
+EXECUTE FUNCTION insert_top_job_skills();
@@ -0,0 +1,7 @@
+-- Let the database enforce job de-duplication, so concurrent crawlers cannot
+-- insert the same posting twice. JobDatabaseInserter relies on these for its
+-- INSERT ... ON CONFLICT DO NOTHING path.
+-- Run once. Existing duplicate job_id / web_id rows must be removed first.
+ALTER TABLE job ADD CONSTRAINT job_pk PRIMARY KEY (job_id);
+
+CREATE UNIQUE INDEX IF NOT EXISTS job_web_id_uq ON job (web_id) WHERE web_id IS NOT NULL;
@@ -64,7 +64,8 @@ def load_backup():
     else:
         print("No new unique jobs to append.")
 
-async def import_legacy_jobs(csv_file_path: str, logger, batch_size: int = 5, start_idx: int = 0) -> Dict[str, int]:
+async def import_legacy_jobs(csv_file_path: str, logger, batch_size: int = 5, start_idx: int = 0,
+                             dedup_state_path: str = None) -> Dict[str, int]:
     """
     Import legacy LinkedIn jobs with async analysis and database insertion.
     
@@ -72,6 +73,7 @@ async def import_legacy_jobs(csv_file_path: str, logger, batch_size: int = 5, st
         csv_file_path (str): Path to the CSV file
         logger: Logger instance
         batch_size (int): Number of jobs to analyze concurrently
+        dedup_state_path (str): Optional file to persist analyzer dedup state across runs
         
     Returns:
         Dict[str, int]: Import statistics
@@ -100,7 +102,7 @@ async def import_legacy_jobs(csv_file_path: str, logger, batch_size: int = 5, st
         jobs_data = df.to_dict('records')
         
         # Initialize components
-        analyzer = AsyncJobAnalyzer(logger)
+        analyzer = AsyncJobAnalyzer(logger, dedup_state_path=dedup_state_path)
         db_inserter = JobDatabaseInserter(logger)
         csv_exporter = JobCSVExporter()
         
@@ -127,14 +129,20 @@ async def import_legacy_jobs(csv_file_path: str, logger, batch_size: int = 5, st
             stats["analyzed"] += len(analyzed_jobs)
             
             # Insert analyzed jobs into the database
+            stored_jobs = []
             for job in analyzed_jobs:
                 if db_inserter.insert_job(job):
                     stats["inserted"] += 1
+                    stored_jobs.append(job)
                 else:
                     stats["errors"] += 1
             
             # Save analyzed jobs to CSV
             csv_exporter.append_jobs_batch(analyzed_jobs, csv_filepath)
+            
+            # Persist dedup state for the jobs that were actually stored
+            analyzer.mark_stored(stored_jobs)
+            analyzer.save_processed_hashes()
         
         logger.info(f"Import completed: {stats['inserted']} jobs inserted, {stats['duplicates']} duplicates skipped, {stats['errors']} errors")
         return stats
@@ -152,6 +160,7 @@ def main():
     parser.add_argument('--batch-size', type=int, default=10, help='Number of jobs to analyze concurrently (default: 5)')
     parser.add_argument('--load-backup', action='store_true', help='Load and consolidate backup files first')
     parser.add_argument('--start-idx', type=int, default=0, help='Start index for batch processing (default: 0)')
+    parser.add_argument('--dedup-state', help='File to persist analyzed job hashes across runs (default: in-memory only)')
     args = parser.parse_args()
     
     # Load backup if requested
@@ -178,7 +187,7 @@ def main():
     
     try:
         # Run the async import process
-        stats = asyncio.run(import_legacy_jobs(args.csv_file, logger, args.batch_size, args.start_idx))
+        stats = asyncio.run(import_legacy_jobs(args.csv_file, logger, args.batch_size, args.start_idx, args.dedup_state))
         
         # Print final statistics
         logger.info("=" * 60)
@@ -5,11 +5,10 @@ import os
 import json
 import re
 import asyncio
-from google import genai
 from google.genai import types
 from pathlib import Path
 from utils.api_key_manager import get_api_key_manager, APIKeyManager
-from utils.getEmbedding import _get_embedding
+from utils.getEmbedding import _get_embeddings_batch
 
 # Đường dẫn đến file instruction.md và skill tags
 INSTRUCTION_PATH = Path(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) / "instruction.md"
@@ -57,7 +56,7 @@ def _analyze_job_content_sync(content: str, job_title: str = "") -> dict:
     while retries < max_retries:
         try:
             print(f"Attempting analysis with API key: {current_key[:12]}...")
-            client = genai.Client(api_key=current_key)
+            client = api_key_manager.get_client(current_key)
             model = "gemini-2.5-flash-lite"
             contents = [
                 types.Content(
@@ -136,11 +135,12 @@ def _analyze_job_content_sync(content: str, job_title: str = "") -> dict:
             for key in required_keys:
                 if key not in result or result[key] in ["", [], {}]:
                     result[key] = None
-            # Embedding for job description and job requirements
-            if result.get("job_description"):
-                result["job_description_embedding"] = _get_embedding(result["job_description"], api_key_manager)
-            if result.get("job_requirements"):
-                result["job_requirements_embedding"] = _get_embedding(result["job_requirements"], api_key_manager)
+            # Embedding for job description and job requirements (one API call for both)
+            embed_fields = [field for field in ("job_description", "job_requirements") if result.get(field)]
+            if embed_fields:
+                embeddings = _get_embeddings_batch([result[field] for field in embed_fields], api_key_manager)
+                for field, embedding in zip(embed_fields, embeddings):
+                    result[f"{field}_embedding"] = embedding
             # print(f"analyzer - Job Expertise: {result.get('job_expertise', 'N/A')}, YOE: {result.get('yoe', 'N/A')}, Salary: {result.get('salary', 'N/A')}")
             return result
         except Exception as e:
@@ -5,6 +5,7 @@ Tự động xoay vòng key khi có lỗi
 
 import os
 from pathlib import Path
+from google import genai
 
 class APIKeyManager:
     def __init__(self, key_file_path=None):
@@ -22,6 +23,7 @@ class APIKeyManager:
             
         self.api_keys = []
         self.current_index = 0
+        self._clients = {}  # api_key -> genai.Client
         self.load_keys()
     
     def load_keys(self):
@@ -52,6 +54,15 @@ class APIKeyManager:
         # Tăng chỉ số và quay vòng nếu cần
         self.current_index = (self.current_index + 1) % len(self.api_keys)
         return self.get_current_key()
+    
+    def get_client(self, api_key=None):
+        """Lấy genai.Client cho API key (tạo một lần, dùng lại cho các lần gọi sau)"""
+        if api_key is None:
+            api_key = self.get_current_key()
+        client = self._clients.get(api_key)
+        if client is None:
+            client = self._clients[api_key] = genai.Client(api_key=api_key)
+        return client
 
 # Singleton instance
 _instance = None
@@ -5,40 +5,61 @@ Handles asynchronous job analysis for legacy data import,
 integrating with the existing analyze_job module.
 """
 
+import os
 import asyncio
 import hashlib
-from typing import Dict, Any, Set, Optional
+import logging
+from array import array
+from typing import Dict, Any, List, Set, Optional, Tuple
 from utils.analyze_job import analyze_job_content
 
+LOG_LEVELS = {"error": logging.ERROR, "warning": logging.WARNING, "info": logging.INFO}
+
 
 class AsyncJobAnalyzer:
-    def __init__(self, logger=None):
+    def __init__(self, logger=None, concurrency: int = 5, dedup_state_path: Optional[str] = None):
         """
         Initialize the async job analyzer.
         
         Args:
             logger: Optional logger instance
+            concurrency (int): Maximum number of jobs analyzed at the same time
+            dedup_state_path (str, optional): File used to persist processed hashes
+                across runs. If None, dedup state only lives in memory.
         """
         self.logger = logger
-        self.processed_hashes: Set[str] = set()
-        self.last_call_time = 0
-        self.min_delay = 4.2  # 4.2 seconds between calls to stay under 15 RPM (60/15 = 4 seconds + buffer)
+        self.processed_hashes: Set[int] = set()
+        # Keys of jobs that were analyzed and stored; only these are persisted
+        self.stored_hashes: Set[int] = set()
+        self.dedup_state_path = dedup_state_path
+        if dedup_state_path:
+            self.load_processed_hashes()
+        
+        # Token bucket limiter: 15 RPM, at most one call may burst at a time
+        self._rate = 15 / 60  # tokens per second
+        self._bucket_capacity = 1.0
+        self._bucket_tokens: float = self._bucket_capacity
+        self._bucket_updated: float = 0.0
+        self._bucket_lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(concurrency)
     
-    def _log(self, message: str, level: str = "info"):
-        """Helper method for logging."""
+    def _log(self, message: str, *args, level: str = "info"):
+        """
+        Helper method for logging.
+        
+        Optional args are %-formatted into the message lazily, only when the
+        logger is enabled for the level.
+        """
         if self.logger:
-            if level == "error":
-                self.logger.error(message)
-            elif level == "warning":
-                self.logger.warning(message)
-            else:
-                self.logger.info(message)
+            levelno = LOG_LEVELS.get(level, logging.INFO)
+            if self.logger.isEnabledFor(levelno):
+                self.logger.log(levelno, message, *args)
         else:
-            print(message)
+            print(message % args if args else message)
     
-    def generate_internal_hash(self, job_title: str, company: str) -> str:
+    def _hash_int(self, job_title: str, company: str) -> int:
         """
-        Generate an internal hash for deduplication tracking.
+        Generate an internal 64-bit hash for deduplication tracking.
         This hash is only used internally and not saved to the database.
         
         Args:
@@ -46,166 +67,241 @@ class AsyncJobAnalyzer:
             company (str): Company name
             
         Returns:
-            str: Internal hash for deduplication
+            int: Internal hash for deduplication
         """
-        # Normalize the inputs
-        title_clean = (job_title or "").strip().lower()
-        company_clean = (company or "").strip().lower()
+        # Normalize the inputs (CSV rows may carry NaN instead of a string)
+        title_clean = str(job_title or "").strip().lower()
+        company_clean = str(company or "").strip().lower()
         
         # Create hash input
         hash_input = f"{title_clean}|{company_clean}"
         
-        # Generate MD5 hash
-        internal_hash = hashlib.md5(hash_input.encode('utf-8')).hexdigest()[:16]
-        return f"internal_{internal_hash}"
+        # Generate a 64-bit BLAKE2b hash (dedup key only, no cryptographic use)
+        digest = hashlib.blake2b(hash_input.encode('utf-8'), digest_size=8).digest()
+        return int.from_bytes(digest, 'little')
     
-    def is_duplicate(self, job_title: str, company: str) -> bool:
+    def _prepare_keys(self, jobs_data: list) -> List[Tuple[int, Dict[str, Any], int]]:
         """
-        Check if a job is a duplicate based on internal hash.
+        Compute dedup keys for a batch of jobs.
+        Runs in a worker thread so hashing large batches doesn't block the event loop.
         
         Args:
-            job_title (str): Job title
-            company (str): Company name
+            jobs_data (list): List of job data dictionaries
             
         Returns:
-            bool: True if duplicate, False otherwise
+            List[Tuple]: (job_index, job_data, job_key) for each job, in input order
         """
-        internal_hash = self.generate_internal_hash(job_title, company)
-        return internal_hash in self.processed_hashes
+        hash_int = self._hash_int
+        return [
+            (i + 1, job_data, hash_int(job_data.get('job_title', ''), job_data.get('company_name', '')))
+            for i, job_data in enumerate(jobs_data)
+        ]
+    
+    def load_processed_hashes(self):
+        """Load processed hashes saved by a previous run, if any."""
+        if not os.path.exists(self.dedup_state_path):
+            return
+        
+        hashes = array('Q')
+        try:
+            with open(self.dedup_state_path, 'rb') as state_file:
+                hashes.frombytes(state_file.read())
+        except (OSError, ValueError) as e:
+            # A truncated or corrupt file only costs the saved dedup state
+            self._log("Ignoring unreadable dedup state %s: %s", self.dedup_state_path, e, level="warning")
+            return
+        self.processed_hashes.update(hashes)
+        self.stored_hashes.update(hashes)
+        self._log("Loaded %d processed job hashes from %s", len(hashes), self.dedup_state_path)
     
-    def mark_as_processed(self, job_title: str, company: str):
+    def mark_stored(self, jobs_data: list):
         """
-        Mark a job as processed to prevent duplicates.
+        Record jobs that were analyzed and stored, so later runs skip them.
         
         Args:
-            job_title (str): Job title
-            company (str): Company name
+            jobs_data (list): Analyzed job data dictionaries that were stored
         """
-        internal_hash = self.generate_internal_hash(job_title, company)
-        self.processed_hashes.add(internal_hash)
+        hash_int = self._hash_int
+        self.stored_hashes.update(
+            hash_int(job_data.get('job_title', ''), job_data.get('company_name', ''))
+            for job_data in jobs_data
+        )
+    
+    def save_processed_hashes(self):
+        """
+        Write stored job hashes to disk as packed unsigned 64-bit integers.
+        
+        Jobs that failed analysis or storage are left out, so a later run
+        retries them instead of skipping them as duplicates.
+        """
+        if not self.dedup_state_path:
+            return
+        
+        tmp_path = f"{self.dedup_state_path}.tmp"
+        with open(tmp_path, 'wb') as state_file:
+            array('Q', self.stored_hashes).tofile(state_file)
+        os.replace(tmp_path, self.dedup_state_path)
     
     async def _enforce_rate_limit(self):
-        """Ensure we don't exceed the 15 RPM rate limit."""
-        import time
-        current_time = time.time()
-        time_since_last_call = current_time - self.last_call_time
+        """
+        Ensure we don't exceed the 15 RPM rate limit.
         
-        if time_since_last_call < self.min_delay:
-            delay = self.min_delay - time_since_last_call
-            self._log(f"  Rate limiting: waiting {delay:.1f} seconds...")
+        Takes one token from the bucket, waiting for a refill if it is empty.
+        The lock is only held while updating the bucket, never while sleeping,
+        so other jobs can keep queueing while one waits.
+        """
+        loop = asyncio.get_running_loop()
+        waited = False
+        while True:
+            async with self._bucket_lock:
+                current_time = loop.time()
+                if self._bucket_updated:
+                    elapsed = current_time - self._bucket_updated
+                    self._bucket_tokens = min(self._bucket_capacity, self._bucket_tokens + elapsed * self._rate)
+                self._bucket_updated = current_time
+                
+                if self._bucket_tokens >= 1:
+                    self._bucket_tokens -= 1
+                    return
+                
+                delay = (1 - self._bucket_tokens) / self._rate
+            
+            # Other jobs may take the refilled token first, so a job can wait
+            # several times; only its first wait is logged
+            if not waited:
+                self._log("  Rate limiting: waiting %.1f seconds...", delay)
+                waited = True
             await asyncio.sleep(delay)
-        
-        self.last_call_time = time.time()
 
-    async def analyze_single_job(self, job_data: Dict[str, Any], job_index: int) -> Optional[Dict[str, Any]]:
+    async def analyze_single_job(self, job_data: Dict[str, Any], job_index: int,
+                                 job_key: Optional[int] = None) -> Optional[Dict[str, Any]]:
         """
         Analyze a single job asynchronously.
         
         Args:
             job_data (Dict): Raw job data from CSV
             job_index (int): Index of the job for logging
+            job_key (int, optional): Precomputed dedup key, computed here if None
             
         Returns:
             Optional[Dict]: Analyzed job data or None if duplicate/error
         """
-        # Enforce rate limiting (sequential processing)
+        # Deduplicate before waiting for a concurrency slot or a rate-limit
+        # token, so duplicates don't consume any of the API budget.
+        # The set only grows if the job had not been seen before. The key is
+        # claimed before analysis so concurrent duplicates are caught, and
+        # released again if the analysis fails so the job can be retried.
+        if job_key is None:
+            job_key = self._hash_int(job_data.get('job_title', ''), job_data.get('company_name', ''))
+        processed = self.processed_hashes
+        seen_count = len(processed)
+        processed.add(job_key)
+        if len(processed) == seen_count:
+            self._log("  Job %d: Skipping duplicate - %.50s...", job_index, job_data.get('job_title', ''))
+            return None
+        
+        async with self._semaphore:
+            result = await self._analyze_job(job_data, job_index)
+        if result is None:
+            processed.discard(job_key)
+        return result
+    
+    async def _analyze_job(self, job_data: Dict[str, Any], job_index: int) -> Optional[Dict[str, Any]]:
+        """Analyze a single, already deduplicated job once a concurrency slot has been acquired."""
+        # Enforce rate limiting (shared across concurrent jobs)
         await self._enforce_rate_limit()
         
         try:
-                # Extract basic info
-                job_title = job_data.get('job_title', '')
-                company = job_data.get('company_name', '')
-                
-                # Check for duplicates
-                if self.is_duplicate(job_title, company):
-                    self._log(f"  Job {job_index}: Skipping duplicate - {job_title[:50]}...")
-                    return None
-                
-                # Mark as processed
-                self.mark_as_processed(job_title, company)
-                
-                self._log(f"  Job {job_index}: Analyzing - {job_title[:50]}...")
-                
-                # Prepare content for analysis
-                description = job_data.get('raw_job_description', '')
-                if not description.strip():
-                    self._log(f"  Job {job_index}: Warning - No description available", level="warning")
-                    description = f"Job title: {job_title}"
-                
-                # Call the existing analyze_job_content function
-                analysis_result = await analyze_job_content(description, job_title)
+            # Extract basic info (each field is looked up once)
+            get = job_data.get
+            job_title = get('job_title', '')
+            company = get('company_name', '')
+            
+            self._log("  Job %d: Analyzing - %.50s...", job_index, job_title)
+            
+            # Prepare content for analysis
+            description = get('raw_job_description', '')
+            if not description.strip():
+                self._log("  Job %d: Warning - No description available", job_index, level="warning")
+                description = f"Job title: {job_title}"
+            
+            # Call the existing analyze_job_content function
+            analysis_result = await analyze_job_content(description, job_title)
+            analysis = analysis_result.get
+            
+            job_id = get('JobID', '')
+            salary = get('Salary', '')
+            location = get('Location', '')
+            posted_date = get('Posted_Date', '')
+            
+            # Merge original data with analysis results
+            enhanced_job_data = {
+                # Original CSV data
+                'JobID': job_id,
+                'Title': job_title,
+                'Company': company,
+                'Salary': salary,
+                'Location': location,
+                'Posted_Date': posted_date,
+                'Link': get('Link', ''),
+                'Benefits': get('Benefits', ''),
+                'Experience': get('Experience', ''),
+                'Skills': get('Skills', ''),  # Legacy field, will be ignored in inserter
                 
-                # Merge original data with analysis results
-                enhanced_job_data = {
-                    # Original CSV data
-                    'JobID': job_data.get('JobID', ''),
-                    'Title': job_title,
-                    'Company': company,
-                    'Salary': job_data.get('Salary', ''),
-                    'Location': job_data.get('Location', ''),
-                    'Posted_Date': job_data.get('Posted_Date', ''),
-                    'Link': job_data.get('Link', ''),
-                    'Benefits': job_data.get('Benefits', ''),
-                    'Experience': job_data.get('Experience', ''),
-                    'Skills': job_data.get('Skills', ''),  # Legacy field, will be ignored in inserter
-                    
-                    # Analysis results
-                    'job_title': job_title,
-                    'company_name': company,
-                    'job_expertise': analysis_result.get('job_expertise', ''),
-                    'yoe': analysis_result.get('yoe', ''),
-                    'salary': analysis_result.get('salary', job_data.get('Salary', '')),
-                    'job_requirements': analysis_result.get('job_requirements', ''),
-                    'job_description': analysis_result.get('job_description', description),
-                    'company_infomation': analysis_result.get('company_infomation', ''),
-                    'work_type': 'Full-time',  # Default value
-                    
-                    # Embeddings (will be handled by inserter)
-                    'job_description_embedding': analysis_result.get('job_description_embedding'),
-                    'job_requirements_embedding': analysis_result.get('job_requirements_embedding'),
-                    
-                    # Metadata
-                    'location': job_data.get('Location', ''),
-                    'posted_date': job_data.get('Posted_Date', ''),
-                    'job_id': job_data.get('JobID', ''),  # Use original JobID as hash
-                }
+                # Analysis results
+                'job_title': job_title,
+                'company_name': company,
+                'job_expertise': analysis('job_expertise', ''),
+                'yoe': analysis('yoe', ''),
+                'salary': analysis('salary', salary),
+                'job_requirements': analysis('job_requirements', ''),
+                'job_description': analysis('job_description', description),
+                'company_infomation': analysis('company_infomation', ''),
+                'work_type': 'Full-time',  # Default value
                 
-                self._log(f"  Job {job_index}: ✓ Analysis completed - {job_title[:30]}...")
-                return enhanced_job_data
+                # Embeddings (will be handled by inserter)
+                'job_description_embedding': analysis('job_description_embedding'),
+                'job_requirements_embedding': analysis('job_requirements_embedding'),
                 
+                # Metadata
+                'location': location,
+                'posted_date': posted_date,
+                'job_id': job_id,  # Use original JobID as hash
+            }
+            
+            self._log("  Job %d: ✓ Analysis completed - %.30s...", job_index, job_title)
+            return enhanced_job_data
+            
         except Exception as e:
-            self._log(f"  Job {job_index}: ✗ Analysis failed - {str(e)}", level="error")
+            self._log("  Job %d: ✗ Analysis failed - %s", job_index, e, level="error")
             return None
     
     async def analyze_jobs_sequentially(self, jobs_data: list) -> list:
         """
-        Analyze jobs sequentially one by one with rate limiting.
-        Use this method for API with strict rate limits (15 RPM).
+        Analyze jobs concurrently while respecting the API rate limit.
+        Calls are started no faster than the 15 RPM budget allows, but the
+        latency of one call overlaps with the wait for the next.
         
         Args:
             jobs_data (list): List of job data dictionaries
             
         Returns:
-            list: List of analyzed job data dictionaries
+            list: List of analyzed job data dictionaries, in input order
         """
-        analyzed_jobs = []
         total_jobs = len(jobs_data)
         
-        self._log(f"Starting sequential analysis of {total_jobs} jobs...")
+        self._log("Starting analysis of %d jobs...", total_jobs)
         
-        # Process jobs one by one
-        for i, job_data in enumerate(jobs_data):
-            job_index = i + 1
-            self._log(f"Processing job {job_index} of {total_jobs}...")
-            
-            # Analyze the single job (rate limiting handled internally)
-            result = await self.analyze_single_job(job_data, job_index)
-            
-            # Add to results if successful
-            if result is not None:
-                analyzed_jobs.append(result)
+        # Hash the whole batch off the event loop
+        keyed_jobs = await asyncio.to_thread(self._prepare_keys, jobs_data)
+        
+        # Deduplication, rate limiting and concurrency are handled inside analyze_single_job
+        results = await asyncio.gather(
+            *(self.analyze_single_job(job_data, job_index, job_key) for job_index, job_data, job_key in keyed_jobs)
+        )
+        analyzed_jobs = [result for result in results if result is not None]
             
-        self._log(f"Analysis completed. Processed {len(analyzed_jobs)} out of {total_jobs} jobs.")
+        self._log("Analysis completed. Processed %d out of %d jobs.", len(analyzed_jobs), total_jobs)
         return analyzed_jobs
         
     def get_stats(self) -> Dict[str, int]:
@@ -0,0 +1,57 @@
+"""
+Bloom Filter for Job Crawler
+
+This module provides a small fixed-size Bloom filter used to answer
+"definitely not seen" questions about job IDs without keeping every ID
+in memory. Positive answers may be false and must be confirmed elsewhere.
+"""
+
+import math
+import hashlib
+from typing import Iterable, List
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over string keys.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """
+        Size the filter for an expected number of keys.
+
+        Args:
+            capacity (int): Number of keys the filter should hold
+            error_rate (float): Target false positive rate at capacity
+        """
+        capacity = max(1, capacity)
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key) -> List[int]:
+        """Derive the bit positions for a key by double hashing one digest."""
+        digest = hashlib.blake2b(str(key).encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, key):
+        """Add a key to the filter."""
+        bits = self._bits
+        for pos in self._positions(key):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def update(self, keys: Iterable):
+        """Add every key from an iterable."""
+        for key in keys:
+            self.add(key)
+
+    def __contains__(self, key) -> bool:
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def __len__(self) -> int:
+        return self.count
@@ -11,34 +11,34 @@ class Colors:
     UNDERLINE = '\033[4m'
     END = '\033[0m'  # End formatting
 
-    @classmethod
-    def red(cls, text: str) -> str:
-        return f"{cls.RED}{text}{cls.END}"
+    @staticmethod
+    def red(text: str, _open: str = RED, _end: str = END) -> str:
+        return _open + text + _end
     
-    @classmethod
-    def green(cls, text: str) -> str:
-        return f"{cls.GREEN}{text}{cls.END}"
+    @staticmethod
+    def green(text: str, _open: str = GREEN, _end: str = END) -> str:
+        return _open + text + _end
     
-    @classmethod
-    def yellow(cls, text: str) -> str:
-        return f"{cls.YELLOW}{text}{cls.END}"
+    @staticmethod
+    def yellow(text: str, _open: str = YELLOW, _end: str = END) -> str:
+        return _open + text + _end
     
-    @classmethod
-    def blue(cls, text: str) -> str:
-        return f"{cls.BLUE}{text}{cls.END}"
+    @staticmethod
+    def blue(text: str, _open: str = BLUE, _end: str = END) -> str:
+        return _open + text + _end
     
-    @classmethod
-    def magenta(cls, text: str) -> str:
-        return f"{cls.MAGENTA}{text}{cls.END}"
+    @staticmethod
+    def magenta(text: str, _open: str = MAGENTA, _end: str = END) -> str:
+        return _open + text + _end
     
-    @classmethod
-    def cyan(cls, text: str) -> str:
-        return f"{cls.CYAN}{text}{cls.END}"
+    @staticmethod
+    def cyan(text: str, _open: str = CYAN, _end: str = END) -> str:
+        return _open + text + _end
     
-    @classmethod
-    def bold(cls, text: str) -> str:
-        return f"{cls.BOLD}{text}{cls.END}"
+    @staticmethod
+    def bold(text: str, _open: str = BOLD, _end: str = END) -> str:
+        return _open + text + _end
     
-    @classmethod
-    def underline(cls, text: str) -> str:
-        return f"{cls.UNDERLINE}{text}{cls.END}"
+    @staticmethod
+    def underline(text: str, _open: str = UNDERLINE, _end: str = END) -> str:
+        return _open + text + _end
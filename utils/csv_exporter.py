@@ -7,18 +7,34 @@ excluding vector columns, and supporting both row-wise and batch operations.
 
 import os
 import csv
-import pandas as pd
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 
 
+def _is_blank(value: Any) -> bool:
+    """True for values that should not win over a legacy key: None, '' and NaN."""
+    return value is None or value == '' or value != value
+
+
 class JobCSVExporter:
     """
     Utility class for exporting job data to CSV files.
     Supports both row-wise appending and batch operations.
     """
     
+    # Legacy CSV keys (e.g. 'Title') read when a column's own key has no value
+    _LEGACY_KEYS = {
+        'job_id': ('JobID',),
+        'job_title': ('Title',),
+        'company_name': ('Company',),
+        'salary': ('Salary',),
+        'location': ('Location',),
+        'posted_date': ('Posted_Date',),
+    }
+    # Standard columns that are never filled from job data
+    _UNMAPPED_COLUMNS = {'company_id'}
+    
     def __init__(self, output_dir: str = None):
         """
         Initialize the CSV exporter.
@@ -50,41 +66,29 @@ class JobCSVExporter:
             'posted_date', 'job_expertise', 'yoe', 'work_type',
             'job_requirements', 'job_description', 'company_id', 'company_description'
         ]
+        
+        # Source keys for each standard column, in column order, built once
+        self._extractors = [
+            () if column in self.exclude_columns or column in self._UNMAPPED_COLUMNS
+            else (column,) + self._LEGACY_KEYS.get(column, ())
+            for column in self.standard_columns
+        ]
     
-    def _filter_job_data(self, job_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _filter_job_data(self, job_data: Dict[str, Any]) -> List[Any]:
         """
-        Filter out vector columns and standardize field names.
+        Filter out vector columns and arrange fields in standard column order.
         
         Args:
             job_data (Dict): Raw job data dictionary
             
         Returns:
-            Dict: Filtered job data suitable for CSV export
+            List: Row values matching self.standard_columns, suitable for csv.writer
         """
-        filtered_data = {}
-        
-        # Map and filter the data
-        field_mapping = {
-            'job_id': job_data.get('job_id', None),
-            'job_title': job_data.get('job_title', None),
-            'company_name': job_data.get('company_name', None),
-            'salary': job_data.get('salary', None),
-            'location': job_data.get('location', None),
-            'posted_date': job_data.get('posted_date', None),
-            'job_expertise': job_data.get('job_expertise', None),
-            'yoe': job_data.get('yoe', None),
-            'work_type': job_data.get('work_type', None),
-            'job_requirements': job_data.get('job_requirements', None),
-            'job_description': job_data.get('job_description', None),
-            'company_description': job_data.get('company_description', None)
-        }
-        
-        # Only include non-vector columns
-        for key, value in field_mapping.items():
-            if key not in self.exclude_columns:
-                filtered_data[key] = value
-        
-        return filtered_data
+        return [
+            next((value for value in map(job_data.get, keys) if not _is_blank(value)),
+                 job_data.get(keys[0]) if keys else None)
+            for keys in self._extractors
+        ]
     
     def generate_filename(self, prefix: str = "linkedin_jobs") -> str:
         """
@@ -113,8 +117,7 @@ class JobCSVExporter:
         
         # Write header row
         with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=self.standard_columns)
-            writer.writeheader()
+            csv.writer(csvfile).writerow(self.standard_columns)
         
         return str(filepath)
     
@@ -130,19 +133,17 @@ class JobCSVExporter:
             bool: True if successful, False otherwise
         """
         try:
-            filtered_data = self._filter_job_data(job_data)
+            row = self._filter_job_data(job_data)
             
             # Ensure file exists
             if not os.path.exists(filepath):
                 # Create file with headers if it doesn't exist
                 with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-                    writer = csv.DictWriter(csvfile, fieldnames=self.standard_columns)
-                    writer.writeheader()
+                    csv.writer(csvfile).writerow(self.standard_columns)
             
             # Append the job data
             with open(filepath, 'a', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=self.standard_columns)
-                writer.writerow(filtered_data)
+                csv.writer(csvfile).writerow(row)
             
             return True
             
@@ -154,20 +155,25 @@ class JobCSVExporter:
         """
         Save a batch of jobs to a CSV file.
         
+        The file is opened once for the whole batch, and rows are built as
+        plain lists in standard column order so csv.writer can write them
+        without per-row dict lookups.
+        
         Args:
             jobs_data (List[Dict]): List of job data dictionaries
             filepath (str): Path to the current CSV file.
             
         Returns:
-            
+            str: Path to the CSV file
         """
-        
-        # Filter all job data
-        filtered_jobs = [self._filter_job_data(job) for job in jobs_data]
-        
-        # Loop to add jobs to CSV
-        for job in filtered_jobs:
-            self.append_single_job(filepath, job)
+        write_header = not os.path.exists(filepath)
+        rows = [self._filter_job_data(job) for job in jobs_data]
+        
+        with open(filepath, 'a', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+            writer = csv.writer(csvfile)
+            if write_header:
+                writer.writerow(self.standard_columns)
+            writer.writerows(rows)
     
         return str(filepath)
     
@@ -8,7 +8,6 @@ saving analyzed job data to CSV files with proper formatting and error handling.
 
 import os
 import csv
-import pandas as pd
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 import hashlib
@@ -41,5 +40,5 @@ class CSVUtils:
         
         # Create hash
         hash_input = f"{title}_{company}"
-        job_id = hashlib.md5(hash_input.encode()).hexdigest()[:16]
+        job_id = hashlib.blake2b(hash_input.encode(), digest_size=8).hexdigest()
         return f"job_{job_id}"
@@ -8,23 +8,19 @@ load_dotenv()
 conn_string = os.getenv('DB_CONNECTION')
 
 try:
-    # Connect to your postgres DB
-    conn = psycopg.connect(conn_string)
-    print("Connected to the database successfully!")
+    # Connect to your postgres DB (closed automatically on exit)
+    with psycopg.connect(conn_string) as conn:
+        print("Connected to the database successfully!")
 
-    # Open a cursor to perform database operations
-    cur = conn.cursor()
+        # Open a server-side cursor so rows are streamed instead of fetched all at once
+        with conn.cursor(name='jobstream') as cur:
+            cur.itersize = 1000
 
-    # Example: Execute a query
-    cur.execute("SELECT * FROM job")
-    jobs = cur.fetchall()
-    print("Jobs in the database:")
-    for job in jobs:
-        print(" -", job)
-
-    # Close the cursor and connection
-    cur.close()
-    conn.close()
+            # Example: Execute a query
+            cur.execute("SELECT * FROM job")
+            print("Jobs in the database:")
+            for job in cur:
+                print(" -", job)
 
 except (Exception, psycopg.Error) as error:
-    print("Error while connecting to PostgreSQL", error)
\ No newline at end of file
+    print("Error while connecting to PostgreSQL", error)
@@ -1,44 +1,123 @@
-from google import genai
+import os
+import hashlib
+import sqlite3
+import threading
+import numpy as np
+from pathlib import Path
 from utils.api_key_manager import get_api_key_manager, APIKeyManager
 from google.genai import types
 
-def _get_embedding(content: str, api_key_manager: APIKeyManager) -> list:
+# On-disk embedding cache, keyed by a hash of the embedded content
+CACHE_PATH = Path(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) / ".emb_cache.sqlite3"
+_cache_conn = None
+_cache_lock = threading.Lock()
+
+# Error message fragments that mean the current API key should be rotated
+RETRYABLE_ERRORS = frozenset(["api key", "quota", "rate limit", "permission", "unauthorized", "authentication", "internal"])
+
+def _cache_key(content: str) -> str:
+    """Hash the content into a compact cache key."""
+    return hashlib.blake2b(content.encode('utf-8'), digest_size=8).hexdigest()
+
+def _get_cache() -> sqlite3.Connection:
+    """Open the embedding cache on first use (shared by all threads)."""
+    global _cache_conn
+    if _cache_conn is None:
+        cache = sqlite3.connect(CACHE_PATH, check_same_thread=False)
+        cache.execute("CREATE TABLE IF NOT EXISTS embedding (key TEXT PRIMARY KEY, vector BLOB NOT NULL)")
+        _cache_conn = cache
+    return _cache_conn
+
+def _cache_get(key: str):
+    """Return the cached embedding for key, or None on a miss."""
+    with _cache_lock:
+        row = _get_cache().execute("SELECT vector FROM embedding WHERE key = ?", (key,)).fetchone()
+    return np.frombuffer(row[0], dtype=np.float32) if row else None
+
+def _cache_set(key: str, values: np.ndarray):
+    """Store an embedding in the cache as raw float32 bytes."""
+    with _cache_lock:
+        cache = _get_cache()
+        cache.execute("INSERT OR REPLACE INTO embedding (key, vector) VALUES (?, ?)", (key, values.tobytes()))
+        cache.commit()
+
+def _get_embedding(content: str, api_key_manager: APIKeyManager):
     """
     Generate an embedding for the given content using the Gemini API.
+    Results are cached on disk, so identical content is only embedded once.
+    """
+    return _get_embeddings_batch([content], api_key_manager)[0]
+
+def _get_embeddings_batch(contents: list, api_key_manager: APIKeyManager) -> list:
+    """
+    Generate embeddings for several contents with a single Gemini API call.
+    Cached contents are served from disk and only the misses are sent.
+    
+    Returns:
+        list: One float32 array per input content, in order (None if it failed)
+    """
+    keys = [_cache_key(content) for content in contents]
+    embeddings = {}
+    pending = {}  # cache key -> content still to embed
+    for key, content in zip(keys, contents):
+        if key in embeddings or key in pending:
+            continue
+        cached = _cache_get(key)
+        if cached is not None:
+            embeddings[key] = cached
+        else:
+            pending[key] = content
+    
+    if pending:
+        values_list = _embed_contents(list(pending.values()), api_key_manager)
+        for key, values in zip(pending, values_list):
+            if values is not None:
+                _cache_set(key, values)
+            embeddings[key] = values
+    
+    return [embeddings[key] for key in keys]
+
+def _embed_contents(contents: list, api_key_manager: APIKeyManager) -> list:
     """
+    Call the Gemini API for a list of contents, rotating API keys on key errors.
+    
+    Returns:
+        list: One float32 array per input content (None entries on failure)
+    """
+    empty = [None] * len(contents)
     max_retries = len(api_key_manager.api_keys)
     retries = 0
     current_key = api_key_manager.get_current_key()
     while retries < max_retries:
-        client = genai.Client(api_key=current_key)
+        client = api_key_manager.get_client(current_key)
         try:
             result_embeddings = client.models.embed_content(
                 model="gemini-embedding-001",
-                contents= content,
+                contents=contents,
                 config=types.EmbedContentConfig(
                     task_type="CLASSIFICATION"  # Specify the task type if needed
                 )
             ).embeddings
-            # Check if the result is valid and contains an embedding
-            if result_embeddings and result_embeddings[0].values:
-                # Extract the list of floats from the first ContentEmbedding object
-                return result_embeddings[0].values
+            # Check if the result is valid and contains one embedding per content
+            if result_embeddings and len(result_embeddings) == len(contents):
+                # Extract the floats from each ContentEmbedding object as a float32 array
+                return [np.asarray(embedding.values, dtype=np.float32) if embedding.values else None
+                        for embedding in result_embeddings]
             else:
                 print("Warning: No embedding was returned from the API.")
-                return []
+                return empty
         except Exception as e:
-            print(f"Error generating embedding: {e}")
             error_message = str(e).lower()
-            api_key_error = any(err in error_message for err in ["api key", "quota", "rate limit", "permission", "unauthorized", "authentication", "internal"])
-            if api_key_error:
-                retries += 1
-                print(f"API key error ({current_key[:12]}...): {e}")
-                if retries < max_retries:
-                    current_key = api_key_manager.next_key()
-                    print(f"Switching to next API key: {current_key[:12]}...")
-                else:
-                    print("Exhausted all API keys, returning empty embedding.")
-                    return []
-            else:
+            if not any(err in error_message for err in RETRYABLE_ERRORS):
                 print(f"An unexpected error occurred. Returning empty embedding. Error: {e}")
-                return []
\ No newline at end of file
+                return empty
+            
+            retries += 1
+            print(f"API key error ({current_key[:12]}...): {e}")
+            if retries < max_retries:
+                current_key = api_key_manager.next_key()
+                print(f"Switching to next API key: {current_key[:12]}...")
+            else:
+                print("Exhausted all API keys, returning empty embedding.")
+                return empty
+    return empty
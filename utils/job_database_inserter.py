@@ -1,29 +1,87 @@
 import os
+import json
+import hashlib
+import numpy as np
 import psycopg
-from datetime import datetime, timezone
-from typing import List, Dict, Optional, Set
+from psycopg import sql
+from psycopg.pq import TransactionStatus
+from datetime import date, datetime, time, timezone
+from typing import List, Dict, Optional
 from dotenv import load_dotenv
+from psycopg.postgres import types as pg_types
+from psycopg.types import TypeInfo
+from pgvector import HalfVector
+from pgvector.psycopg import register_vector
+from pgvector.psycopg.halfvec import HalfVectorBinaryDumper
+from .bloom_filter import BloomFilter
 
 # Load environment variables
 load_dotenv()
 
+# Columns written for every job row, in insert/COPY order
+JOB_COLUMNS = (
+    "job_id", "job_title", "job_expertise", "yoe", "salary", "location",
+    "posted_date", "requirements", "requirements_embedding",
+    "description", "description_embedding", "web_id", "company_id",
+)
+
+# posted_date is coerced per column type, since binary COPY dumpers are strict
+POSTED_DATE_INDEX = JOB_COLUMNS.index("posted_date")
+TIMESTAMP_OID = pg_types["timestamp"].oid
+TIMESTAMPTZ_OID = pg_types["timestamptz"].oid
+DATE_OID = pg_types["date"].oid
+
+# Embeddings are sent as float16 only when their column is halfvec
+REQUIREMENTS_EMBEDDING_INDEX = JOB_COLUMNS.index("requirements_embedding")
+DESCRIPTION_EMBEDDING_INDEX = JOB_COLUMNS.index("description_embedding")
+
+# Single-row insert used when COPY is not an option
+INSERT_JOB_QUERY = f"""
+    INSERT INTO job ({", ".join(JOB_COLUMNS)})
+    VALUES ({", ".join(["%s"] * len(JOB_COLUMNS))})
+    ON CONFLICT DO NOTHING
+"""
+
+class _HalfVectorArrayDumper(HalfVectorBinaryDumper):
+    """Binary halfvec dumper that also accepts numpy arrays, for COPY set_types."""
+    
+    def dump(self, obj):
+        if not isinstance(obj, HalfVector):
+            obj = HalfVector(obj)
+        return obj.to_binary()
+
 class JobDatabaseInserter:
     """
     Utility class to insert analyzed job data into the database.
     Handles deduplication and company management.
     """
     
+    # Existing IDs live in Bloom filters sized for at least this many keys
+    MIN_FILTER_CAPACITY = 1_000_000
+    # Rows fetched per round-trip when streaming loaders through named cursors
+    LOADER_ITERSIZE = 50_000
+    # Transaction settings for insert_job_batch; an async commit can lose the
+    # last batches on a server crash but never corrupts data
+    BATCH_SETTINGS = (
+        "synchronous_commit = off",
+        "work_mem = '256MB'",
+    )
+    # Session settings used while rebuilding vector indexes after a bulk load
+    INDEX_BUILD_MEMORY = '2GB'
+    INDEX_BUILD_WORKERS = 7
+    
     def __init__(self, logger=None):
         self.conn = None
         self.cur = None
-        self.existing_job_ids: Set[str] = set()
+        self.existing_job_ids = BloomFilter(self.MIN_FILTER_CAPACITY)
         self.companies_cache: Dict[str, str] = {}  # company_name -> company_id
-        self.existing_web_ids: Set[str] = set()  # For LinkedIn jobs
+        self.existing_web_ids = BloomFilter(self.MIN_FILTER_CAPACITY)  # For LinkedIn jobs
         self.logger = logger  # Logger instance (if provided)
+        self._copy_types: Optional[List[int]] = None  # JOB_COLUMNS type OIDs for binary COPY
+        self._halfvec_oid: Optional[int] = None  # None if the server has no halfvec type
         self.connect_to_database()
-        self.load_existing_job_ids()
+        self.load_existing_ids()
         self.load_companies_cache()
-        self.load_existing_web_ids()
 
     def connect_to_database(self):
         """Connect to the PostgreSQL database."""
@@ -33,6 +91,8 @@ class JobDatabaseInserter:
                 raise ValueError("DB_CONNECTION environment variable not found")
             
             self.conn = psycopg.connect(conn_string)
+            register_vector(self.conn)
+            self._register_halfvec_arrays()
             self.cur = self.conn.cursor()
             self._log("✓ JobDatabaseInserter connected to database successfully!")
             
@@ -40,6 +100,16 @@ class JobDatabaseInserter:
             self._log(f"✗ Error connecting to database: {e}", level="error")
             raise
     
+    def _register_halfvec_arrays(self):
+        """Let binary COPY write numpy arrays straight into halfvec columns."""
+        info = TypeInfo.fetch(self.conn, 'halfvec')
+        if info is None:  # pgvector < 0.7 has no halfvec
+            return
+        self._halfvec_oid = info.oid
+        dumper = type('', (_HalfVectorArrayDumper,), {'oid': info.oid})
+        # Registered by OID only, so plain parameters keep using the vector dumper
+        self.conn.adapters.register_dumper(None, dumper)
+    
     def _log(self, message, level="info"):
         """Helper method for logging messages with logger or print."""
         if self.logger:
@@ -52,53 +122,107 @@ class JobDatabaseInserter:
         else:
             print(message)
             
-    def load_existing_job_ids(self):
-        """Load all existing job IDs from the database to check for duplicates."""
+    def _new_id_filter(self) -> BloomFilter:
+        """Create a Bloom filter sized from the planner's estimate of the job table."""
+        self.cur.execute("SELECT reltuples::bigint FROM pg_class WHERE oid = 'job'::regclass")
+        estimate = self.cur.fetchone()[0]
+        return BloomFilter(max(2 * estimate, self.MIN_FILTER_CAPACITY))
+    
+    def load_existing_ids(self):
+        """Load existing job IDs and web IDs in one pass over the job table for duplicate checking."""
         try:
-            self.cur.execute("SELECT job_id FROM job")
-            rows = self.cur.fetchall()
-            self.existing_job_ids = {str(row[0]) for row in rows}
-            self._log(f"Loaded {len(self.existing_job_ids)} existing job IDs for duplicate checking")
+            existing_job_ids = self._new_id_filter()
+            existing_web_ids = self._new_id_filter()
+            with self.conn.cursor(name='existing_ids') as cur:
+                cur.itersize = self.LOADER_ITERSIZE
+                cur.execute("SELECT job_id, web_id FROM job")
+                for job_id, web_id in cur:
+                    existing_job_ids.add(str(job_id))
+                    if web_id is not None:
+                        existing_web_ids.add(str(web_id))
+            self.existing_job_ids = existing_job_ids
+            self.existing_web_ids = existing_web_ids
+            self._log(f"Loaded {len(self.existing_job_ids)} existing job IDs and "
+                      f"{len(self.existing_web_ids)} web IDs for duplicate checking")
         except Exception as e:
             self._log(f"Error loading existing job IDs: {e}", level="error")
-            self.existing_job_ids = set()
-
-    def load_existing_web_ids(self):
-        """Load all existing web IDs from the database to check for LinkedIn job duplicates."""
-        try:
-            self.cur.execute("SELECT web_id FROM job")
-            rows = self.cur.fetchall()
-            self.existing_web_ids = {str(row[0]) for row in rows}
-            self._log(f"Loaded {len(self.existing_web_ids)} existing web IDs")
-        except Exception as e:
-            self._log(f"Error loading existing web IDs: {e}", level="error")
-            self.existing_web_ids = set()
+            self.conn.rollback()
+            self.existing_job_ids = BloomFilter(self.MIN_FILTER_CAPACITY)
+            self.existing_web_ids = BloomFilter(self.MIN_FILTER_CAPACITY)
     
     def load_companies_cache(self):
         """Load existing companies from the database."""
         try:
-            self.cur.execute("SELECT company_name, company_id FROM company")
-            rows = self.cur.fetchall()
-            self.companies_cache = {row[0]: row[1] for row in rows}
+            with self.conn.cursor(name='companies_cache') as cur:
+                cur.itersize = self.LOADER_ITERSIZE
+                cur.execute("SELECT company_name, company_id FROM company")
+                self.companies_cache = {row[0]: row[1] for row in cur}
             self._log(f"Loaded {len(self.companies_cache)} companies into cache")
         except Exception as e:
             self._log(f"Error loading companies cache: {e}", level="error")
+            self.conn.rollback()
             self.companies_cache = {}
 
     def is_duplicate_job(self, job_id: str, web_id: str) -> bool:
-        """Check if a job ID already exists in the database."""
-        return (str(job_id) in self.existing_job_ids or
-                str(web_id) in self.existing_web_ids)
+        """
+        Check if a job ID already exists in the database.
+        
+        The Bloom filters rule out new jobs without a query; a hit may be a
+        false positive, so it is confirmed against the job table.
+        """
+        job_id, web_id = str(job_id), str(web_id)
+        if job_id not in self.existing_job_ids and web_id not in self.existing_web_ids:
+            return False
+        try:
+            self.cur.execute("SELECT 1 FROM job WHERE job_id = %s OR web_id = %s LIMIT 1", (job_id, web_id))
+            return self.cur.fetchone() is not None
+        except Exception as e:
+            self._log(f"Error confirming duplicate job {job_id[:8]}: {e}", level="error")
+            return True
 
-    def _generate_company_id(self, company_name: str) -> str:
-        """Generate a unique company ID based on company name."""
-        import hashlib
-        import time
+    def _confirm_duplicates(self, keys: List[tuple]) -> List[bool]:
+        """
+        Confirm Bloom filter hits against the job table in one pipeline flight.
         
-        # Create a hash from company name + current timestamp for uniqueness
-        hash_input = f"{company_name.lower().strip()}_{int(time.time())}"
-        company_id = hashlib.md5(hash_input.encode()).hexdigest()[:12]
-        return f"comp_{company_id}"
+        Args:
+            keys (List[tuple]): (job_id, web_id) pairs the Bloom filters flagged
+            
+        Returns:
+            List[bool]: Whether each pair really exists, in input order
+        """
+        if not keys:
+            return []
+        try:
+            found = []
+            # Savepoint: a failed lookup must not abort the caller's batch transaction
+            with self.conn.transaction(), self.conn.pipeline():
+                self.cur.executemany(
+                    "SELECT 1 FROM job WHERE job_id = %s OR web_id = %s LIMIT 1",
+                    keys, returning=True,
+                )
+                while True:
+                    found.append(self.cur.fetchone() is not None)
+                    if not self.cur.nextset():
+                        break
+            return found
+        except Exception as e:
+            # ON CONFLICT DO NOTHING still guards the insert
+            self._log(f"Error confirming duplicate jobs: {e}", level="error")
+            return [False] * len(keys)
+    
+    def _generate_company_id(self, company_name: str) -> str:
+        """Generate a deterministic company ID from the company name as it is stored."""
+        # Hash exactly what goes into the (case-sensitive) unique company_name,
+        # so two names that ON CONFLICT keeps apart never share a company_id
+        digest = hashlib.blake2b(self._company_key(company_name).encode(), digest_size=6)
+        return f"comp_{digest.hexdigest()}"
+    
+    @staticmethod
+    def _company_key(company_name: str) -> str:
+        """Normalize a company name the way it is cached and stored."""
+        if not company_name or company_name.strip() == "":
+            return "Unknown Company"
+        return company_name.strip()
     
     def get_or_create_company(self, company_name: str, company_description: str = None) -> str:
         """
@@ -111,10 +235,7 @@ class JobDatabaseInserter:
         Returns:
             str: company_id
         """
-        if not company_name or company_name.strip() == "":
-            company_name = "Unknown Company"
-            
-        company_name = company_name.strip()
+        company_name = self._company_key(company_name)
         
         # Check cache first
         if company_name in self.companies_cache:
@@ -145,82 +266,236 @@ class JobDatabaseInserter:
             # Return a default company_id
             return "comp_default"
     
-    def insert_job(self, job_data: Dict) -> Optional[str]:
+    def _resolve_companies(self, job_data_list: List[Dict]):
+        """
+        Populate companies_cache for every company in a batch with one upsert.
+        
+        The no-op DO UPDATE makes RETURNING yield ids for companies that
+        already exist as well as for the ones just inserted.
+        """
+        missing = {}
+        for job_data in job_data_list:
+            company_name = self._company_key(job_data.get("company_name"))
+            if company_name not in self.companies_cache and company_name not in missing:
+                missing[company_name] = job_data.get("company_description", None)
+        if not missing:
+            return
+        
+        try:
+            names = list(missing)
+            # Savepoint: on failure only the upsert is undone, not the batch
+            with self.conn.transaction():
+                self.cur.execute("""
+                    INSERT INTO company (company_id, company_name, company_description)
+                    SELECT * FROM unnest(%s::text[], %s::text[], %s::text[])
+                    ON CONFLICT (company_name) DO UPDATE SET company_name = EXCLUDED.company_name
+                    RETURNING company_id, company_name
+                """, ([self._generate_company_id(name) for name in names], names, list(missing.values())))
+                resolved = self.cur.fetchall()
+            self.companies_cache.update({name: company_id for company_id, name in resolved})
+        except Exception as e:
+            # Per-row lookups take over for this batch
+            self._log(f"Error resolving companies for batch: {e}", level="error")
+    
+    def insert_job(self, job_data: Dict, commit: bool = True) -> Optional[str]:
         """
         Insert a single job into the database.
         
+        The row is written inside a savepoint, so a failure only discards this
+        job and leaves the caller's transaction usable.
+        
         Args:
             job_data (Dict): Job data dictionary with all the fields
+            commit (bool): Commit right away; pass False to leave the commit
+                to the caller's batch boundary
             
         Returns:
             Optional[str]: The inserted job_id if successful, None otherwise
         """
         try:
-            import random, time
             job_id_hash = str(job_data.get("job_id", ""))
             web_id = str(job_data.get("web_id", ""))
             if self.is_duplicate_job(job_id_hash, web_id):
                 self._log(f"  [Job ID hash check] Skipping duplicate job: {job_id_hash[:8]}...")
                 return "duplication"
 
-            # Get or create company
+            # Convert embeddings to arrays; None or empty embeddings become NULL
+            requirements_embedding = self._vector_array(
+                job_data.get("job_requirements_embedding"), REQUIREMENTS_EMBEDDING_INDEX
+            )
+            description_embedding = self._vector_array(
+                job_data.get("job_description_embedding"), DESCRIPTION_EMBEDDING_INDEX
+            )
+            
             company_name = job_data.get("company_name", "Unknown Company")
             company_description = job_data.get("company_description", None)
-            company_id = self.get_or_create_company(company_name, company_description)
             
-            # Insert job record
-            insert_query = """
-                INSERT INTO job (
-                    job_id, job_title, job_expertise, yoe, salary, location, 
-                    posted_date, requirements, requirements_embedding, 
-                    description, description_embedding, web_id, company_id
+            with self.conn.transaction():
+                # Get or create company
+                company_id = self.get_or_create_company(company_name, company_description)
+                values = (
+                    job_id_hash,  # Use hash as job_id
+                    job_data.get("job_title", None),
+                    job_data.get("job_expertise", None),
+                    job_data.get("yoe", None),
+                    job_data.get("salary", None),
+                    job_data.get("location", None),
+                    job_data.get("posted_date", datetime.now(timezone.utc)),
+                    job_data.get("job_requirements", None),
+                    requirements_embedding,
+                    job_data.get("job_description", None),
+                    description_embedding,
+                    job_data.get("web_id", None),
+                    company_id,
                 )
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """
-            
-            # Convert embeddings to proper format if they exist
-            requirements_embedding = job_data.get("job_requirements_embedding")
-            description_embedding = job_data.get("job_description_embedding")
-            
-            # Handle None or empty embeddings - convert to None for pgvector
-            if not requirements_embedding or requirements_embedding == "[]":
-                requirements_embedding = None
-            if not description_embedding or description_embedding == "[]":
-                description_embedding = None
-            
-            values = (
-                job_id_hash,  # Use hash as job_id
-                job_data.get("job_title", None),
-                job_data.get("job_expertise", None),
-                job_data.get("yoe", None),
-                job_data.get("salary", None),
-                job_data.get("location", None),
-                job_data.get("posted_date", datetime.now(timezone.utc)),
-                job_data.get("job_requirements", None),
-                requirements_embedding,  # pgvector will handle the list
-                job_data.get("job_description", None),
-                description_embedding,  # pgvector will handle the list
-                job_data.get("web_id", None),
-                company_id,
-            )
-            
-            self.cur.execute(insert_query, values)
-            self.conn.commit()  # Ensure changes are saved
+                # Insert job record; prepared so repeat calls skip parse/plan
+                self.cur.execute(INSERT_JOB_QUERY, values, prepare=True)
+                inserted = self.cur.rowcount
+            if commit:
+                self.conn.commit()  # Ensure changes are saved
             self.existing_job_ids.add(job_id_hash)
+            if not inserted:
+                self._log(f"  [Unique constraint] Skipping duplicate job: {job_id_hash[:8]}...")
+                return "duplication"
             self._log(f"  ✓ Inserted job: {job_id_hash[:8]} - {job_data.get('job_title', 'Unknown')[:50]}")
-            
-            # Add random sleep between 0.2 and 1.2 seconds
-            time.sleep(random.uniform(0.2, 1.2))
             return job_id_hash
         except Exception as e:
             self._log(f"  ✗ Error inserting job: {e}", level="error")
-            self.conn.rollback()
+            # A company created inside the rolled-back savepoint no longer exists
+            self.companies_cache.pop(self._company_key(job_data.get("company_name")), None)
+            if commit:
+                self.conn.rollback()
             return None
     
+    def _vector_array(self, embedding, column_index: int) -> Optional[np.ndarray]:
+        """
+        Convert an embedding to an array for pgvector, or None if empty.
+        
+        halfvec columns get float16, since anything beyond that precision is
+        dropped anyway; vector columns keep float32.
+        """
+        if isinstance(embedding, str):
+            embedding = json.loads(embedding) if embedding.strip() else None
+        if embedding is None or len(embedding) == 0:
+            return None
+        is_halfvec = self._load_copy_types()[column_index] == self._halfvec_oid
+        return np.asarray(embedding, dtype=np.float16 if is_halfvec else np.float32)
+    
+    @staticmethod
+    def _timestamp(value, oid: int):
+        """
+        Coerce a posted_date value to what the binary dumper of its column takes.
+        
+        Naive datetimes are taken as UTC; timestamp columns get naive values and
+        timestamptz columns aware ones. Empty or unparsable values become NULL.
+        """
+        if isinstance(value, str):
+            try:
+                value = datetime.fromisoformat(value.strip())
+            except ValueError:
+                return None
+        elif isinstance(value, date) and not isinstance(value, datetime):
+            value = datetime.combine(value, time())
+        if not isinstance(value, datetime):
+            return None  # None, NaN and other non-dates
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        if oid == TIMESTAMPTZ_OID:
+            return value.replace(tzinfo=timezone.utc)
+        if oid == DATE_OID:
+            return value.date()
+        return value.replace(tzinfo=None)
+    
+    def _load_copy_types(self) -> List[int]:
+        """Look up the type OIDs of JOB_COLUMNS, used by binary COPY and to pick embedding dtypes."""
+        if self._copy_types is None:
+            self.cur.execute("""
+                SELECT attname, atttypid FROM pg_attribute
+                WHERE attrelid = 'job'::regclass AND attnum > 0 AND NOT attisdropped
+            """)
+            oids = dict(self.cur.fetchall())
+            self._copy_types = [oids[column] for column in JOB_COLUMNS]
+        return self._copy_types
+    
+    def _copy_row(self, job_id: str, job_data: Dict, company_id: str) -> tuple:
+        """Build a job row in JOB_COLUMNS order for binary COPY."""
+        # A missing posted_date defaults to now, as in insert_job
+        posted_date = self._timestamp(
+            job_data.get("posted_date", datetime.now(timezone.utc)),
+            self._load_copy_types()[POSTED_DATE_INDEX],
+        )
+        return (
+            job_id,
+            job_data.get("job_title", None),
+            job_data.get("job_expertise", None),
+            job_data.get("yoe", None),
+            job_data.get("salary", None),
+            job_data.get("location", None),
+            posted_date,
+            job_data.get("job_requirements", None),
+            self._vector_array(job_data.get("job_requirements_embedding"), REQUIREMENTS_EMBEDDING_INDEX),
+            job_data.get("job_description", None),
+            self._vector_array(job_data.get("job_description_embedding"), DESCRIPTION_EMBEDDING_INDEX),
+            job_data.get("web_id", None),
+            company_id,
+        )
+    
+    def _copy_job_rows(self, rows: List[tuple], pending_jobs: List[Dict], stats: Dict[str, int]) -> int:
+        """
+        Write a batch's rows into job inside the caller's transaction.
+        
+        The rows go through one binary COPY in a savepoint; if that fails,
+        each job is retried with insert_job in its own savepoint.
+        
+        Returns:
+            int: Number of rows inserted
+        """
+        try:
+            with self.conn.transaction():
+                copy_types = self._load_copy_types()
+                columns = ", ".join(JOB_COLUMNS)
+                # COPY cannot skip conflicts, so stage the rows and let the
+                # unique constraints on job decide what gets inserted
+                self.cur.execute("""
+                    CREATE TEMP TABLE IF NOT EXISTS job_stage
+                    (LIKE job INCLUDING DEFAULTS) ON COMMIT DELETE ROWS
+                """)
+                with self.cur.copy(f"COPY job_stage ({columns}) FROM STDIN WITH (FORMAT BINARY)") as copy:
+                    copy.set_types(copy_types)
+                    for row in rows:
+                        copy.write_row(row)
+                self.cur.execute(f"""
+                    INSERT INTO job ({columns})
+                    SELECT {columns} FROM job_stage
+                    ON CONFLICT DO NOTHING
+                """)
+                inserted = self.cur.rowcount
+            stats["duplicates"] += len(rows) - inserted
+            self._log(f"  ✓ Copied {inserted} jobs in one transaction")
+            return inserted
+        except Exception as e:
+            self._log(f"  ✗ COPY failed, falling back to row-by-row insert: {e}", level="error")
+        
+        inserted = 0
+        for job_data in pending_jobs:
+            result = self.insert_job(job_data, commit=False)
+            if result == "duplication":
+                stats["duplicates"] += 1
+            elif result:
+                inserted += 1
+            else:
+                stats["errors"] += 1
+        return inserted
+    
     def insert_job_batch(self, job_data_list: List[Dict]) -> Dict[str, int]:
         """
         Insert a batch of analyzed jobs into the database.
         
+        The whole batch is one transaction. Non-duplicate rows are streamed
+        with a single binary COPY into a staging table and moved into job with
+        ON CONFLICT DO NOTHING; if the COPY fails the batch falls back to
+        row-by-row inserts, each in a savepoint of the same transaction.
+        
         Args:
             job_data_list (List[Dict]): List of job data dictionaries
             
@@ -236,30 +511,85 @@ class JobDatabaseInserter:
         
         self._log(f"\n📊 Inserting {stats['total']} jobs into database...")
         
-        for i, job_data in enumerate(job_data_list, 1):
-            try:
-                job_id = job_data.get("job_id", f"unknown_{i}")
-                web_id = job_data.get("web_id", "")
-                self._log(f"  Processing {i}/{stats['total']}: {job_id[:8]}...")
+        # Earlier lookups leave an implicit transaction open; end it so the
+        # block below is this batch's own transaction, not a savepoint in that one
+        if self.conn.info.transaction_status != TransactionStatus.IDLE:
+            self.conn.commit()
+        
+        # Companies created in this transaction vanish on rollback
+        known_companies = dict(self.companies_cache)
+        batch_job_ids = set()
+        batch_web_ids = set()
+        inserted = 0
+        try:
+            with self.conn.transaction():
+                candidates = []
+                bloom_hits = []  # (job_id, web_id) of candidates the Bloom filters flagged
+                for i, job_data in enumerate(job_data_list, 1):
+                    try:
+                        job_id = str(job_data.get("job_id", f"unknown_{i}"))
+                        web_id = str(job_data.get("web_id", ""))
+                        
+                        # Check for duplicate within this batch
+                        if job_id in batch_job_ids or (web_id and web_id in batch_web_ids):
+                            stats["duplicates"] += 1
+                            self._log(f"    ⚠ Duplicate job skipped: {job_id[:8]}...")
+                            continue
+                        
+                        maybe_duplicate = job_id in self.existing_job_ids or web_id in self.existing_web_ids
+                        if maybe_duplicate:
+                            bloom_hits.append((job_id, web_id))
+                        candidates.append((i, job_id, job_data, maybe_duplicate))
+                        batch_job_ids.add(job_id)
+                        if web_id:
+                            batch_web_ids.add(web_id)
+                            
+                    except Exception as e:
+                        self._log(f"    ✗ Error processing job {i}: {e}", level="error")
+                        stats["errors"] += 1
+                        continue
                 
-                # Check for duplicate
-                if self.is_duplicate_job(str(job_id), str(web_id)):
-                    stats["duplicates"] += 1
-                    self._log(f"    ⚠ Duplicate job skipped")
-                    continue
+                # Check for duplicate in the database, confirming all Bloom hits at once
+                confirmed = iter(self._confirm_duplicates(bloom_hits))
+                new_jobs = []
+                for i, job_id, job_data, maybe_duplicate in candidates:
+                    if maybe_duplicate and next(confirmed):
+                        stats["duplicates"] += 1
+                        self._log(f"    ⚠ Duplicate job skipped: {job_id[:8]}...")
+                        continue
+                    new_jobs.append((i, job_id, job_data))
+                candidates = new_jobs
                 
-                # Insert job
-                success = self.insert_job(job_data)
+                # Resolve every company the batch needs in one round-trip
+                self._resolve_companies([job_data for _, _, job_data in candidates])
                 
-                if success:
-                    stats["inserted"] += 1
-                else:
-                    stats["errors"] += 1
-                    
-            except Exception as e:
-                self._log(f"    ✗ Error processing job {i}: {e}", level="error")
-                stats["errors"] += 1
-                continue
+                rows = []
+                pending_jobs = []
+                for i, job_id, job_data in candidates:
+                    try:
+                        company_id = self.get_or_create_company(
+                            job_data.get("company_name", "Unknown Company"),
+                            job_data.get("company_description", None),
+                        )
+                        rows.append(self._copy_row(job_id, job_data, company_id))
+                        pending_jobs.append(job_data)
+                    except Exception as e:
+                        self._log(f"    ✗ Error processing job {i}: {e}", level="error")
+                        stats["errors"] += 1
+                
+                if rows:
+                    # Bulk-load settings for this transaction only, also covering
+                    # the fallback; they end at its commit
+                    for setting in self.BATCH_SETTINGS:
+                        self.cur.execute(f"SET LOCAL {setting}")
+                    inserted = self._copy_job_rows(rows, pending_jobs, stats)
+            stats["inserted"] += inserted
+            self.existing_job_ids.update(batch_job_ids)
+            self.existing_web_ids.update(batch_web_ids)
+        except Exception as e:
+            self._log(f"  ✗ Batch insert failed, batch rolled back: {e}", level="error")
+            self.companies_cache = known_companies
+            stats["errors"] = stats["total"] - stats["duplicates"]
         
         # Print summary
         self._log(f"\n📈 Batch insertion summary:")
@@ -270,6 +600,98 @@ class JobDatabaseInserter:
         
         return stats
     
+    def _drop_vector_indexes(self) -> List[str]:
+        """Drop the HNSW/IVFFlat indexes on job and return their definitions."""
+        self.cur.execute("""
+            SELECT indexname, indexdef FROM pg_indexes
+            WHERE schemaname = current_schema() AND tablename = 'job'
+              AND indexdef ~* 'USING (hnsw|ivfflat)'
+        """)
+        indexes = self.cur.fetchall()
+        for index_name, index_def in indexes:
+            self.cur.execute(f'DROP INDEX "{index_name}"')
+            # Logged so the index can be recreated by hand if the load dies
+            self._log(f"  Dropped index: {index_def}")
+        self.conn.commit()
+        return [index_def for _, index_def in indexes]
+    
+    def _rebuild_indexes(self, index_defs: List[str]):
+        """Recreate dropped indexes with extra memory and parallel workers for the build."""
+        self.cur.execute(f"SET maintenance_work_mem = '{self.INDEX_BUILD_MEMORY}'")
+        self.cur.execute(f"SET max_parallel_maintenance_workers = {self.INDEX_BUILD_WORKERS}")
+        try:
+            for index_def in index_defs:
+                try:
+                    self.cur.execute(index_def)
+                    self.conn.commit()
+                    self._log(f"  ✓ Rebuilt index: {index_def}")
+                except Exception as e:
+                    self._log(f"  ✗ Error rebuilding index, run it manually: {index_def}: {e}", level="error")
+                    self.conn.rollback()
+        finally:
+            self.cur.execute("RESET maintenance_work_mem")
+            self.cur.execute("RESET max_parallel_maintenance_workers")
+            self.conn.commit()
+    
+    def _autovacuum_setting(self) -> Optional[str]:
+        """Return job's explicit autovacuum_enabled reloption, or None if it is unset."""
+        try:
+            self.cur.execute("""
+                SELECT option_value FROM pg_class, pg_options_to_table(reloptions)
+                WHERE pg_class.oid = 'job'::regclass AND option_name = 'autovacuum_enabled'
+            """)
+            row = self.cur.fetchone()
+            self.conn.commit()
+            return row[0] if row else None
+        except Exception as e:
+            self._log(f"Error reading autovacuum setting on job: {e}", level="warning")
+            self.conn.rollback()
+            return None
+    
+    def _set_autovacuum(self, value: Optional[str]):
+        """Set autovacuum_enabled on job around a bulk load; None resets it to the default."""
+        try:
+            if value is None:
+                self.cur.execute("ALTER TABLE job RESET (autovacuum_enabled)")
+            else:
+                self.cur.execute(sql.SQL("ALTER TABLE job SET (autovacuum_enabled = {})").format(sql.Literal(value)))
+            self.conn.commit()
+        except Exception as e:
+            self._log(f"Error changing autovacuum on job: {e}", level="warning")
+            self.conn.rollback()
+    
+    def bulk_load(self, job_data_list: List[Dict], batch_size: int = 5000) -> Dict[str, int]:
+        """
+        Load a large number of jobs with the vector indexes dropped.
+        
+        Maintaining HNSW/IVFFlat indexes row by row dominates large ingests,
+        so the indexes on job are dropped first, the jobs are inserted in
+        batches with autovacuum paused, and the indexes are rebuilt from
+        their original definitions.
+        
+        Args:
+            job_data_list (List[Dict]): List of job data dictionaries
+            batch_size (int): Jobs per insert_job_batch call
+            
+        Returns:
+            Dict[str, int]: Statistics about the insertion, summed over batches
+        """
+        totals = {"total": 0, "inserted": 0, "duplicates": 0, "errors": 0}
+        index_defs = self._drop_vector_indexes()
+        self._log(f"Dropped {len(index_defs)} vector indexes for bulk load")
+        # Restored afterwards, so an explicit per-table setting survives the load
+        previous_autovacuum = self._autovacuum_setting()
+        self._set_autovacuum("false")
+        try:
+            for start in range(0, len(job_data_list), batch_size):
+                stats = self.insert_job_batch(job_data_list[start:start + batch_size])
+                for key in totals:
+                    totals[key] += stats[key]
+        finally:
+            self._set_autovacuum(previous_autovacuum)
+            self._rebuild_indexes(index_defs)
+        return totals
+    
     def get_database_stats(self) -> Dict[str, int]:
         """Get current database statistics."""
         try:
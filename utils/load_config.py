@@ -1,7 +1,34 @@
 import yaml
 import os
+import copy
+import functools
 from typing import Dict, Any
 
+try:
+    from yaml import CSafeLoader as SafeLoader  # LibYAML bindings
+except ImportError:
+    from yaml import SafeLoader
+
+
+@functools.lru_cache(maxsize=32)
+def _load_config_cached(config_path: str, mtime: float) -> Dict[str, Any]:
+    """
+    Parse a YAML configuration file once per (path, mtime).
+    
+    The modification time is part of the cache key, so editing the file
+    invalidates the cached result.
+    """
+    # Load and parse YAML file
+    with open(config_path, 'r', encoding='utf-8') as file:
+        config = yaml.load(file, Loader=SafeLoader)
+        
+    # Validate that config is not empty
+    if config is None:
+        config = {}
+        
+    print(f"Successfully loaded configuration from: {config_path}")
+    return config
+
 
 def load_config(config_path: str) -> Dict[str, Any]:
     """
@@ -23,16 +50,9 @@ def load_config(config_path: str) -> Dict[str, Any]:
         if not os.path.exists(config_path):
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
         
-        # Load and parse YAML file
-        with open(config_path, 'r', encoding='utf-8') as file:
-            config = yaml.safe_load(file)
-            
-        # Validate that config is not empty
-        if config is None:
-            config = {}
-            
-        print(f"Successfully loaded configuration from: {config_path}")
-        return config
+        # Callers mutate the config they get back, so hand out a copy of the cached one
+        config = _load_config_cached(config_path, os.path.getmtime(config_path))
+        return copy.deepcopy(config)
         
     except yaml.YAMLError as e:
         print(f"Error parsing YAML file {config_path}: {e}")
@@ -1,14 +1,203 @@
+import atexit
+import functools
+import json
 import logging
+import logging.handlers
 import os
-from datetime import datetime
+import queue
+import sys
+import threading
+import time
 from typing import Optional
 
+# Separator line around crawler start/end summaries
+_BANNER = "=" * 60
+
+
+def _to_json(data: dict) -> str:
+    """Serialize a dict onto one log line; non-JSON values fall back to str()."""
+    return json.dumps(data, default=str, ensure_ascii=False)
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that renders asctime once per second instead of once per record.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._time_cache = (None, "")  # (whole second, formatted time)
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        datefmt = datefmt or self.datefmt
+        if not datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, formatted = self._time_cache
+        if second != cached_second:
+            formatted = time.strftime(datefmt, self.converter(second))
+            self._time_cache = (second, formatted)
+        return formatted
+
+
+class BufferedFileHandler(logging.Handler):
+    """
+    File handler that batches writes in a preallocated 64 KB buffer instead of
+    flushing every record. The buffer is flushed when full, on ERROR and above,
+    and periodically by the owning CrawlerLogger. Like FileHandler(delay=True),
+    the file is only opened by the first record, so unused loggers leave no
+    empty files behind. Like RotatingFileHandler, the file is rolled over to
+    .1 ... .N backups once it would grow past max_bytes.
+    
+    Writes go straight to a raw O_APPEND descriptor with os.write, which drops
+    the GIL for the syscall, so crawler threads keep running during disk I/O.
+    """
+    
+    terminator = '\n'
+    
+    def __init__(self, filename: str, encoding: str = 'utf-8', buffer_size: int = 65536,
+                 max_bytes: int = 16 * 1024 * 1024, backup_count: int = 5):
+        super().__init__()
+        self.baseFilename = os.path.abspath(filename)
+        self.encoding = encoding
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._fd = None
+        self._buffer = bytearray(buffer_size)
+        self._used = 0  # bytes of _buffer holding pending records
+        self._size = 0  # bytes in the current file, including buffered ones
+    
+    def _open(self) -> int:
+        """Open the log file for appending and return its descriptor."""
+        fd = os.open(self.baseFilename, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self._size = os.lseek(fd, 0, os.SEEK_END)
+        return fd
+    
+    def _write(self, data):
+        """Write all of data to the file, retrying short writes."""
+        with memoryview(data) as view:
+            while view:
+                view = view[os.write(self._fd, view):]
+    
+    def _write_buffer(self):
+        """Write out the pending part of the buffer."""
+        if self._used:
+            with memoryview(self._buffer) as view:
+                self._write(view[:self._used])
+            self._used = 0
+    
+    def do_rollover(self):
+        """Close the current file and shift it to .1, dropping the oldest backup."""
+        if self._fd is not None:
+            try:
+                self._write_buffer()
+            finally:
+                fd, self._fd = self._fd, None
+                os.close(fd)
+        if self.backup_count > 0:
+            for i in range(self.backup_count - 1, 0, -1):
+                source = f"{self.baseFilename}.{i}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.baseFilename}.{i + 1}")
+            os.replace(self.baseFilename, f"{self.baseFilename}.1")
+        else:
+            os.truncate(self.baseFilename, 0)
+        self._fd = self._open()
+    
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        """Errors go to disk right away; everything else waits for the buffer."""
+        return record.levelno >= logging.ERROR
+    
+    def emit(self, record: logging.LogRecord):
+        try:
+            data = (self.format(record) + self.terminator).encode(self.encoding)
+            size = len(data)
+            if self._fd is None:
+                self._fd = self._open()
+            if self.max_bytes > 0 and self._size and self._size + size > self.max_bytes:
+                self.do_rollover()
+            if self._used + size > len(self._buffer):
+                self._write_buffer()
+            if size > len(self._buffer):
+                self._write(data)  # larger than the whole buffer: write it through
+            else:
+                # Copy into the preallocated buffer; the slice keeps its length,
+                # so the bytearray is never reallocated
+                self._buffer[self._used:self._used + size] = data
+                self._used += size
+            self._size += size
+            if self.shouldFlush(record):
+                self._write_buffer()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def flush(self):
+        self.acquire()
+        try:
+            if self._fd is not None:
+                self._write_buffer()
+        finally:
+            self.release()
+    
+    def close(self):
+        self.acquire()
+        try:
+            if self._fd is not None:
+                try:
+                    self._write_buffer()
+                finally:
+                    fd, self._fd = self._fd, None
+                    os.close(fd)
+            super().close()
+        finally:
+            self.release()
+    
+    def __del__(self):
+        # Dropped without close() (e.g. by logging.shutdown clearing the
+        # MemoryHandler target): still write out what is buffered
+        if getattr(self, '_fd', None) is not None:
+            try:
+                self._write_buffer()
+            finally:
+                fd, self._fd = self._fd, None
+                os.close(fd)
+
+
+class ConsoleHandler(logging.StreamHandler):
+    """
+    Console handler writing to a line-buffered UTF-8 view of stderr. Each
+    record ends in a newline, so line buffering already delivers it and the
+    explicit flush StreamHandler does per record is skipped.
+    """
+    
+    def __init__(self):
+        try:
+            # closefd=False: dropping the handler must not close the process's stderr
+            stream = open(sys.stderr.fileno(), 'w', encoding='utf-8',
+                          buffering=1, closefd=False)
+        except (AttributeError, OSError, ValueError):
+            stream = sys.stderr  # no real fd behind stderr (e.g. captured output)
+        super().__init__(stream)
+    
+    def emit(self, record: logging.LogRecord):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
 class CrawlerLogger:
     """
     Centralized logging utility for job crawler operations.
     Creates separate log files for different crawler types and operations.
     """
     
+    PROGRESS_BATCH = 50
+    
     def __init__(self, log_dir: str = "logs"):
         """
         Initialize the logger with a specified log directory.
@@ -20,11 +209,94 @@ class CrawlerLogger:
         self.ensure_log_directory()
         self.loggers = {}
         
+        # Loggers only enqueue records; one listener thread formats them and
+        # does all file/console I/O off the crawler threads
+        self._log_queue = queue.Queue(-1)
+        # One formatter serves the console and every log file. Records are
+        # formatted on the listener thread and, via MemoryHandler.flush, on the
+        # flusher thread; the time cache is a single tuple swap, so a race only
+        # costs a redundant strftime
+        self._formatter = CachedTimeFormatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+        # Only warnings and errors reach the console; INFO stays in the log files
+        self._console_handler = ConsoleHandler()
+        self._console_handler.setLevel(logging.WARNING)
+        self._console_handler.setFormatter(self._formatter)
+        self._listener = None
+        self._start_listener()
+        atexit.register(self._close_handlers)
+        
+        # Records collect in memory handlers in front of buffered file handlers;
+        # one thread pushes both layers to disk every second. The file handlers
+        # are kept here too, since MemoryHandler.close() drops its target.
+        self._memory_handlers = []
+        self._file_handlers = []
+        self._flush_stop = threading.Event()
+        self._flusher = None
+        self._start_flusher()
+        
+        # Per-job progress lines are grouped into one record every
+        # PROGRESS_BATCH jobs, or sooner when the same logger logs anything
+        # else or the process exits: logger name -> (logger, pending lines)
+        self._progress = {}
+        self._progress_lock = threading.Lock()
+    
+    def _flush_loop(self, interval: float = 1.0):
+        """Flush buffered log records periodically to bound log latency."""
+        while not self._flush_stop.wait(interval):
+            for handler in list(self._memory_handlers):
+                target = handler.target
+                if target is None:  # closed by close_all_loggers meanwhile
+                    continue
+                handler.flush()
+                target.flush()
+    
+    def _start_flusher(self):
+        """Start the periodic flush thread if it is not running."""
+        if self._flusher is None:
+            self._flush_stop.clear()
+            self._flusher = threading.Thread(target=self._flush_loop, name="log-flusher", daemon=True)
+            self._flusher.start()
+    
+    def _start_listener(self):
+        """Start the queue listener thread if it is not running."""
+        if self._listener is None:
+            self._listener = logging.handlers.QueueListener(
+                self._log_queue, self._console_handler, respect_handler_level=True
+            )
+            self._listener.start()
+    
+    def _stop_listener(self):
+        """Stop the listener thread once every queued record has been handled."""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+    def _close_handlers(self):
+        """Drain the queue, then flush and close every file handler (also run at exit)."""
+        self.flush_progress()
+        self._flush_stop.set()
+        if self._flusher is not None:
+            self._flusher.join()
+            self._flusher = None
+        self._stop_listener()
+        for handler in self._memory_handlers:
+            handler.close()  # flushes pending records into its file handler
+        for handler in self._file_handlers:
+            handler.close()
+        self._memory_handlers = []
+        self._file_handlers = []
+
     def ensure_log_directory(self):
         """Create log directory if it doesn't exist."""
-        if not os.path.exists(self.log_dir):
+        # Let mkdir report an existing directory rather than stat-ing first
+        try:
             os.makedirs(self.log_dir)
-            print(f"✓ Created log directory: {self.log_dir}")
+        except FileExistsError:
+            return
+        print(f"✓ Created log directory: {self.log_dir}")
     
     def get_logger(self, logger_name: str, log_file: Optional[str] = None) -> logging.Logger:
         """
@@ -43,112 +315,143 @@ class CrawlerLogger:
         # Create logger
         logger = logging.getLogger(logger_name)
         logger.setLevel(logging.INFO)
+        # Records go through our queue only, never again through the root logger
+        logger.propagate = False
         
         # Clear any existing handlers
         logger.handlers.clear()
         
-        # Create formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        
         # File handler
+        # One fixed file per logger; size-based rotation handles turnover
         if log_file is None:
-            timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
-            log_file = f"{logger_name}_{timestamp}.log"
+            log_file = f"{logger_name}.log"
         
         log_path = os.path.join(self.log_dir, log_file)
-        file_handler = logging.FileHandler(log_path, encoding='utf-8')
+        file_handler = BufferedFileHandler(log_path, encoding='utf-8')
         file_handler.setLevel(logging.INFO)
-        file_handler.setFormatter(formatter)
-        
-        # Console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
-        console_handler.setFormatter(formatter)
+        file_handler.setFormatter(self._formatter)
+        # Batch records in memory and write them out together; errors flush at once
+        memory_handler = logging.handlers.MemoryHandler(
+            1024, flushLevel=logging.ERROR, target=file_handler, flushOnClose=True
+        )
+        # The listener is shared, so only this logger's records reach its file
+        memory_handler.addFilter(logging.Filter(logger_name))
         
-        # Add handlers to logger
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        # Hand the handlers to the listener; the logger itself only enqueues
+        self._start_listener()
+        self._start_flusher()
+        self._listener.handlers += (memory_handler,)
+        self._memory_handlers.append(memory_handler)
+        self._file_handlers.append(file_handler)
+        queue_handler = logging.handlers.QueueHandler(self._log_queue)
+        queue_handler.addFilter(self._flush_progress_before)
+        logger.addHandler(queue_handler)
         
         # Store logger
         self.loggers[logger_name] = logger
-        
-        logger.info(f"Logger '{logger_name}' initialized - Log file: {log_path}")
         return logger
     
     def get_linkedin_logger(self) -> logging.Logger:
         """Get logger specifically for LinkedIn crawler operations."""
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
-        return self.get_logger("linkedin_crawler", f"linkedin_crawler_{timestamp}.log")
+        return self.get_logger("linkedin_crawler", "linkedin_crawler.log")
     
     def get_itviec_logger(self) -> logging.Logger:
         """Get logger specifically for ITviec crawler operations."""
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
-        return self.get_logger("itviec_crawler", f"itviec_crawler_{timestamp}.log")
+        return self.get_logger("itviec_crawler", "itviec_crawler.log")
     
     def get_database_logger(self) -> logging.Logger:
         """Get logger specifically for database operations."""
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
-        return self.get_logger("database_operations", f"database_{timestamp}.log")
+        return self.get_logger("database_operations", "database.log")
     
     def get_ai_logger(self) -> logging.Logger:
         """Get logger specifically for AI analysis operations."""
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
-        return self.get_logger("ai_analysis", f"ai_analysis_{timestamp}.log")
+        return self.get_logger("ai_analysis", "ai_analysis.log")
     
     def log_crawler_start(self, logger: logging.Logger, crawler_type: str, config: dict):
         """Log the start of a crawler operation with configuration details."""
-        logger.info("=" * 60)
-        logger.info(f"🚀 Starting {crawler_type} Crawler Operation")
-        logger.info("=" * 60)
-        logger.info(f"Configuration:")
-        for key, value in config.items():
-            if isinstance(value, dict):
-                logger.info(f"  {key}:")
-                for sub_key, sub_value in value.items():
-                    logger.info(f"    {sub_key}: {sub_value}")
-            else:
-                logger.info(f"  {key}: {value}")
-        logger.info("=" * 60)
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        logger.info(_BANNER)
+        logger.info("🚀 Starting %s Crawler Operation", crawler_type)
+        logger.info(_BANNER)
+        logger.info("Configuration: %s", _to_json(config))
+        logger.info(_BANNER)
     
     def log_crawler_end(self, logger: logging.Logger, crawler_type: str, stats: dict):
         """Log the end of a crawler operation with statistics."""
-        logger.info("=" * 60)
-        logger.info(f"🏁 {crawler_type} Crawler Operation Completed")
-        logger.info("=" * 60)
-        logger.info("Final Statistics:")
-        for key, value in stats.items():
-            logger.info(f"  {key}: {value}")
-        logger.info("=" * 60)
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        self.flush_progress(logger)
+        logger.info(_BANNER)
+        logger.info("🏁 %s Crawler Operation Completed", crawler_type)
+        logger.info(_BANNER)
+        logger.info("Final Statistics: %s", _to_json(stats))
+        logger.info(_BANNER)
     
     def log_job_processing(self, logger: logging.Logger, job_index: int, total_jobs: int, job_title: str, status: str):
-        """Log individual job processing status."""
-        logger.info(f"[{job_index}/{total_jobs}] {status}: {job_title}")
+        """Log individual job processing status (buffered, see flush_progress)."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        line = f"[{job_index}/{total_jobs}] {status}: {job_title}"
+        with self._progress_lock:
+            lines = self._progress.setdefault(logger.name, (logger, []))[1]
+            lines.append(line)
+            if len(lines) < self.PROGRESS_BATCH:
+                return
+            del self._progress[logger.name]
+        logger.info("\n".join(lines))
+    
+    def flush_progress(self, logger: Optional[logging.Logger] = None):
+        """
+        Emit buffered job progress lines as one record per logger.
+        
+        Args:
+            logger (logging.Logger, optional): Logger to flush. If None, flushes all
+        """
+        with self._progress_lock:
+            if logger is None:
+                pending = list(self._progress.values())
+                self._progress.clear()
+            else:
+                entry = self._progress.pop(logger.name, None)
+                pending = [entry] if entry else []
+        for progress_logger, lines in pending:
+            progress_logger.info("\n".join(lines))
+    
+    def _flush_progress_before(self, record: logging.LogRecord) -> bool:
+        """Queue filter: emit a logger's buffered progress ahead of its other records."""
+        if record.name in self._progress:
+            self.flush_progress(logging.getLogger(record.name))
+        return True
     
     def log_error(self, logger: logging.Logger, operation: str, error: Exception, context: dict = None):
         """Log errors with context information."""
-        logger.error(f"❌ Error in {operation}: {str(error)}")
+        if not logger.isEnabledFor(logging.ERROR):
+            return
+        # The traceback rides on the error record itself instead of a second
+        # logger.exception record
+        logger.error("❌ Error in %s: %s", operation, error, exc_info=True)
         if context:
-            logger.error(f"Context: {context}")
-        logger.exception("Full stack trace:")
+            logger.error("Context: %s", context)
     
     def log_warning(self, logger: logging.Logger, message: str, context: dict = None):
         """Log warnings with optional context."""
-        logger.warning(f"⚠️  {message}")
+        logger.warning("⚠️  %s", message)
         if context:
-            logger.warning(f"Context: {context}")
+            logger.warning("Context: %s", context)
     
     def log_success(self, logger: logging.Logger, message: str, details: dict = None):
         """Log successful operations with optional details."""
-        logger.info(f"✅ {message}")
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        logger.info("✅ %s", message)
         if details:
-            for key, value in details.items():
-                logger.info(f"  {key}: {value}")
+            logger.info("Details: %s", _to_json(details))
     
     def close_all_loggers(self):
         """Close all logger handlers and clear the loggers dict."""
+        # Emit buffered progress, then drain the queue before any file handler is closed
+        self._close_handlers()
         for logger_name, logger in self.loggers.items():
             for handler in logger.handlers[:]:
                 handler.close()
@@ -157,25 +460,28 @@ class CrawlerLogger:
         print("✓ All loggers closed")
 
 
-# Global logger instance
-crawler_logger = CrawlerLogger()
+# Shared logger instance, created on first use
+@functools.cache
+def _instance() -> CrawlerLogger:
+    """Return the process-wide CrawlerLogger, creating it on first call."""
+    return CrawlerLogger()
 
 # Convenience functions for quick access
 def get_linkedin_logger():
     """Quick access to LinkedIn logger."""
-    return crawler_logger.get_linkedin_logger()
+    return _instance().get_linkedin_logger()
 
 def get_itviec_logger():
     """Quick access to ITviec logger."""
-    return crawler_logger.get_itviec_logger()
+    return _instance().get_itviec_logger()
 
 def get_database_logger():
     """Quick access to database logger."""
-    return crawler_logger.get_database_logger()
+    return _instance().get_database_logger()
 
 def get_ai_logger():
     """Quick access to AI analysis logger."""
-    return crawler_logger.get_ai_logger()
+    return _instance().get_ai_logger()
 
 
 # Example usage
@@ -192,4 +498,4 @@ if __name__ == "__main__":
     db_logger.info("Testing database logger")
     
     # Close all loggers
-    crawler_logger.close_all_loggers()
+    _instance().close_all_loggers()